@@ -1,40 +1,127 @@
 # bloggie_unwarper_gui.py
 # GUI Bloggie (donut) → panorama unwarper with File menu + toolbar buttons.
-# Dependencies: pip install opencv-python pillow numpy
+# Dependencies: pip install opencv-python pillow numpy  (optional: numba, for a faster map build)
+# Set BLOGGIE_REMAP=cuda or BLOGGIE_REMAP=opencl to remap on a GPU (default: cpu).
 
-import json, math
-from pathlib import Path
+import math, os, time
+from concurrent.futures import ThreadPoolExecutor
 import cv2, numpy as np
-from PIL import Image, ImageTk
 import tkinter as tk
 from tkinter import filedialog, ttk, messagebox
+try:
+    from numba import njit, prange
+except ImportError:  # optional; falls back to the NumPy map build
+    njit = None
 
 Y_WARP_A, Y_WARP_B, Y_WARP_C = 0.1850, 0.8184, -0.0028
 ASPECT = 360.0 / 55.0  # Bloggie default
 
+if njit is not None:
+    # explicit signatures: compiled when the module is imported (or loaded from the on-disk
+    # cache on later launches) instead of on the first slider move
+    @njit("UniTuple(f8[::1], 2)(i8, f8)", fastmath=True, cache=True)
+    def _angle_tables_nb(unw_w, shift):
+        # the map is separable, so trig is done once per column
+        ca = np.empty(unw_w); sa = np.empty(unw_w)
+        for j in range(unw_w):
+            angle = -(j / unw_w) * (2.0*math.pi) + shift
+            ca[j] = math.cos(angle); sa[j] = math.sin(angle)
+        return ca, sa
+
+    @njit("void(f4[:, ::1], f4[:, ::1], i8, i8, f8, f8, f8, f8, f8, f8, f8, f8)",
+          parallel=True, fastmath=True, cache=True)
+    def _build_map_nb(mx, my, unw_w, unw_h, cx, cy, rmin, rmax, shift, yA, yB, yC):
+        # fused build_map: one pass over the output, no full-size temporaries
+        ca, sa = _angle_tables_nb(unw_w, shift)
+        for i in prange(unw_h):
+            y = i / unw_h
+            radius = ((yA*y + yB)*y + yC) * (rmax - rmin) + rmin
+            for j in range(unw_w):
+                mx[i, j] = cx + radius * ca[j]
+                my[i, j] = cy + radius * sa[j]
+
+    # warm-up on a 4x4 dummy: also starts numba's thread pool before the first real frame
+    _mx = np.empty((4, 4), np.float32)
+    _build_map_nb(_mx, np.empty_like(_mx), 4, 4, 2.0, 2.0, 0.5, 2.0, 0.0, Y_WARP_A, Y_WARP_B, Y_WARP_C)
+    del _mx
+else:
+    _build_map_nb = None
+
+def _build_map_tables(unw_w, unw_h, rmin, rmax, yA=Y_WARP_A, yB=Y_WARP_B, yC=Y_WARP_C):
+    # the map is separable: radius depends on the row only, angle on the column only.
+    # Both tables are built in place (Horner form for radius) without per-term temporaries.
+    y = np.arange(unw_h, dtype=np.float32); y /= unw_h
+    radius = np.empty(unw_h, np.float32)
+    np.multiply(y, yA, out=radius); np.add(radius, yB, out=radius)
+    np.multiply(radius, y, out=radius); np.add(radius, yC, out=radius)
+    radius *= (rmax - rmin); radius += rmin
+    angle_base = np.arange(unw_w, dtype=np.float32); angle_base *= -2.0*math.pi / unw_w
+    return radius[:, None], angle_base[None, :]
+
 def build_map(unw_w, unw_h, cx, cy, rmin, rmax, shift=0.0, yA=Y_WARP_A, yB=Y_WARP_B, yC=Y_WARP_C):
-    xs = np.arange(unw_w, dtype=np.float32)[None, :]
-    ys = np.arange(unw_h, dtype=np.float32)[:, None]
-    y = ys / float(unw_h)
-    yfrac = yA*(y**2) + yB*y + yC
-    radius = (yfrac * (rmax - rmin)) + rmin
-    angle  = (0.0 - (xs / float(unw_w)) * (2.0*math.pi)) + shift
-    map_x = cx + radius * np.cos(angle)
-    map_y = cy + radius * np.sin(angle)
-    return map_x.astype(np.float32), map_y.astype(np.float32)
+    map_x = np.empty((unw_h, unw_w), np.float32); map_y = np.empty_like(map_x)
+    if _build_map_nb is not None:
+        _build_map_nb(map_x, map_y, int(unw_w), int(unw_h), float(cx), float(cy), float(rmin), float(rmax),
+                      float(shift), float(yA), float(yB), float(yC))
+        return map_x, map_y
+    radius, angle = _build_map_tables(unw_w, unw_h, rmin, rmax, yA, yB, yC)
+    angle += shift
+    ca = np.cos(angle); sa = np.sin(angle, out=angle)
+    np.multiply(radius, ca, out=map_x); map_x += cx
+    np.multiply(radius, sa, out=map_y); map_y += cy
+    return map_x, map_y
+
+def remap_backend():
+    # "cpu" unless BLOGGIE_REMAP=cuda|opencl asks for a device and OpenCV has one: per-frame
+    # map uploads and downloads usually cost more than a display-sized remap saves
+    wanted = os.environ.get("BLOGGIE_REMAP", "cpu").lower()
+    if wanted == "cuda":
+        try:
+            if cv2.cuda.getCudaEnabledDeviceCount() > 0: return "cuda"
+        except (AttributeError, cv2.error):  # OpenCV built without the cuda module
+            pass
+    if wanted == "opencl" and cv2.ocl.haveOpenCL() and cv2.ocl.useOpenCL(): return "opencl"
+    return "cpu"
+
+INTERP_MODES = {"nearest": cv2.INTER_NEAREST, "linear": cv2.INTER_LINEAR, "cubic": cv2.INTER_CUBIC}
+MOTION_INTERVAL = 0.016  # s, minimum spacing of applied drag events
+INTERP_DURING_DRAG = "linear"  # no nearest jitter, about half the cost of cubic
+
+def remap_tiles():
+    # OpenCV parallelises remap itself unless built without a parallel framework (TBB,
+    # OpenMP, pthreads...); only then is it worth splitting the output across our own threads
+    return 1 if cv2.getNumThreads() > 1 else (os.cpu_count() or 1)
+
+def interp_mode(interp):
+    return INTERP_MODES.get(interp, cv2.INTER_CUBIC)
 
 def unwarp(img_bgr, unw_w, cx, cy, rmin, rmax, shift_rad, interp="nearest"):
     unw_h = int(round(unw_w / ASPECT))
     mx, my = build_map(unw_w, unw_h, cx, cy, rmin, rmax, shift_rad)
-    mode = cv2.INTER_NEAREST if interp == "nearest" else cv2.INTER_CUBIC
-    return cv2.remap(img_bgr, mx, my, interpolation=mode, borderMode=cv2.BORDER_CONSTANT, borderValue=0)
+    return cv2.remap(img_bgr, mx, my, interpolation=interp_mode(interp), borderMode=cv2.BORDER_CONSTANT, borderValue=0)
+
+PANEL_BG = (0x22, 0x22, 0x22, 0xFF)  # "#222" as RGBX
+
+def fit_size(w, h, fit_w, fit_h):
+    # shrink-to-fit like PIL's thumbnail; never enlarges
+    s = min(fit_w / w, fit_h / h, 1.0)
+    return max(1, round(w*s)), max(1, round(h*s))
 
-def cv2_to_tk(bgr, fit_w=None, fit_h=None):
-    rgb = cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)
-    pil = Image.fromarray(rgb)
-    if fit_w and fit_h:
-        pil.thumbnail((fit_w, fit_h), Image.LANCZOS)
-    return ImageTk.PhotoImage(pil), pil.size
+def make_panel(w, h):
+    # RGBX buffer shared with a PIL image (frombuffer maps RGBX without copying) and a
+    # PhotoImage that is refilled from it with paste() instead of being recreated per frame
+    from PIL import Image, ImageTk  # deferred: not needed to bring the window up
+    buf = np.empty((h, w, 4), np.uint8); buf[:] = PANEL_BG
+    pil = Image.frombuffer("RGBX", (w, h), buf, "raw", "RGBX", 0, 1)
+    return buf, pil, ImageTk.PhotoImage(pil)
+
+def blit_bgr(disp, bgr):
+    # centre a BGR image (already fitted) in an RGBX panel buffer, clearing the margins
+    H, W = disp.shape[:2]; h, w = bgr.shape[:2]
+    y0, x0 = (H - h) // 2, (W - w) // 2
+    disp[:y0] = PANEL_BG; disp[y0+h:] = PANEL_BG
+    disp[y0:y0+h, :x0] = PANEL_BG; disp[y0:y0+h, x0+w:] = PANEL_BG
+    np.copyto(disp[y0:y0+h, x0:x0+w, 2::-1], bgr)
 
 class BloggieGUI(tk.Tk):
     def __init__(self):
@@ -59,6 +146,19 @@ class BloggieGUI(tk.Tk):
 
         self._pending = None
         self._dragging = False
+        self._shift_scrubbing = False
+        self._motion_job = None; self._motion_xy = None; self._last_motion_ts = 0.0
+        self._last_overlay_state = None  # (cx, cy, rmin, rmax) the left panel was drawn for
+        self._last_key = self._last_pano = self._shown_key = None  # see _compute_pano
+        self._preview_w = 640  # pano width rendered while dragging/scrubbing (right panel width)
+        self._backend = remap_backend()
+        self._src_dev = None  # img_bgr uploaded for the cuda/opencl backends
+        self._tiles = remap_tiles()
+        self._pool = ThreadPoolExecutor(max_workers=self._tiles) if self._tiles > 1 else None
+        self._bufs = {}  # name -> reusable uint8 output buffer, see _buffer()
+        self._map_cache = {}  # (unw_w, rmin, rmax) -> base tables + map buffers
+        for var in (self.rmin, self.rmax, self.pano_w):
+            var.trace_add("write", self._invalidate_maps)
 
         self._build_menu()
         self._build_main()
@@ -85,6 +185,7 @@ class BloggieGUI(tk.Tk):
         # canvases
         self.left = tk.Label(self, bg="#222")
         self.right = tk.Label(self, bg="#222")
+        self.after(0, self._build_panels)  # PIL is imported once the window is up
         self.left.place(x=10, y=10, width=600, height=600)
         self.right.place(x=630, y=10, width=640, height=600)
         for ev, fn in [("<Button-1>", self._start_drag),
@@ -122,14 +223,21 @@ class BloggieGUI(tk.Tk):
             wid.grid(row=1, column=col, padx=(0,8), pady=2, sticky="w"); col += 1
 
         L("Rotate (°)").grid(row=1, column=col, padx=(10,4), pady=2, sticky="w"); col += 1
-        ttk.Scale(bar, from_=0, to=360, variable=self.shift_deg, command=lambda e: self.refresh()
-                 ).grid(row=1, column=col, padx=(0,12), pady=2, sticky="we"); col += 1
+        scale = ttk.Scale(bar, from_=0, to=360, variable=self.shift_deg, command=lambda e: self.refresh())
+        scale.grid(row=1, column=col, padx=(0,12), pady=2, sticky="we"); col += 1
+        scale.bind("<ButtonPress-1>", self._start_scrub)
+        scale.bind("<ButtonRelease-1>", self._stop_scrub)
 
         L("Interp").grid(row=1, column=col, padx=(6,4), pady=2, sticky="w"); col += 1
-        cmb = ttk.Combobox(bar, values=["nearest","cubic"], textvariable=self.interp, width=8, state="readonly")
+        cmb = ttk.Combobox(bar, values=list(INTERP_MODES), textvariable=self.interp, width=8, state="readonly")
         cmb.grid(row=1, column=col, padx=(0,8), pady=2, sticky="w")
         cmb.bind("<<ComboboxSelected>>", lambda e: self.refresh())
 
+    def _build_panels(self):
+        self._left_disp, self._left_pil, self._left_ptk = make_panel(600, 600)
+        self._right_disp, self._right_pil, self._right_ptk = make_panel(640, 600)
+        self.left.configure(image=self._left_ptk); self.right.configure(image=self._right_ptk)
+
     # ---------- I/O ----------
     def load_image(self):
         path = filedialog.askopenfilename(
@@ -141,6 +249,17 @@ class BloggieGUI(tk.Tk):
         if img is None:
             messagebox.showerror("Error", f"Could not open: {path}"); return
         self.img_path = path; self.img_bgr = img; self.h, self.w = img.shape[:2]
+        if self._backend == "cuda":
+            self._src_dev = cv2.cuda_GpuMat(); self._src_dev.upload(img)
+        elif self._backend == "opencl":
+            self._src_dev = cv2.UMat(img)
+        # the left panel is drawn on a display-sized copy, resized once per image
+        self._left_scale = min(600 / self.w, 600 / self.h)
+        self._left_small = cv2.resize(img, None, fx=self._left_scale, fy=self._left_scale, interpolation=cv2.INTER_AREA)
+        self._left_buf = np.empty_like(self._left_small)
+        sh, sw = self._left_small.shape[:2]
+        self._left_off = ((600 - sw) // 2, (600 - sh) // 2)  # as placed by blit_bgr
+        self._last_overlay_state = self._last_key = self._shown_key = None
         # sensible defaults (Processing sketch)
         self.rmax.set(self.h/2.0 * 0.72)
         self.rmin.set(self.h/2.0 * 0.16)
@@ -159,6 +278,8 @@ class BloggieGUI(tk.Tk):
 
     def save_params(self):
         if self.img_bgr is None: return
+        import json
+        from pathlib import Path
         data = dict(
             image_path=self.img_path, w=int(self.w), h=int(self.h),
             cx=float(self.cx.get()), cy=float(self.cy.get()),
@@ -170,17 +291,32 @@ class BloggieGUI(tk.Tk):
         if out: Path(out).write_text(json.dumps(data, indent=2)); messagebox.showinfo("Saved", out)
 
     # ---------- Interaction ----------
-    def _start_drag(self, e): self._dragging = True;  self._update_center_from_click(e)
-    def _drag(self, e):       self._update_center_from_click(e) if self._dragging else None
-    def _stop_drag(self, e):  self._dragging = False
+    def _start_drag(self, e): self._dragging = True;  self._update_center_from_click(e.x, e.y)
+    def _start_scrub(self, e): self._shift_scrubbing = True
+    def _stop_scrub(self, e):  self._shift_scrubbing = False; self.refresh()
+
+    def _drag(self, e):
+        # pointer events are throttled to ~60/s; only the latest position is applied
+        if not self._dragging: return
+        self._motion_xy = (e.x, e.y)
+        if self._motion_job is None:
+            wait = self._last_motion_ts + MOTION_INTERVAL - time.monotonic()
+            self._motion_job = self.after(max(0, int(wait * 1000)), self._apply_motion)
 
-    def _update_center_from_click(self, e):
+    def _apply_motion(self):
+        self._motion_job = None; self._last_motion_ts = time.monotonic()
+        self._update_center_from_click(*self._motion_xy)
+
+    def _stop_drag(self, e):
+        self._dragging = False
+        if self._motion_job is not None:
+            self.after_cancel(self._motion_job); self._apply_motion()
+        else: self.refresh()
+
+    def _update_center_from_click(self, ex, ey):
         if self.img_bgr is None: return
-        disp_w, disp_h = 600, 600
-        scale = min(disp_w / self.w, disp_h / self.h)
-        img_w, img_h = self.w * scale, self.h * scale
-        off_x, off_y = (disp_w - img_w)/2.0, (disp_h - img_h)/2.0
-        x = (e.x - off_x) / scale; y = (e.y - off_y) / scale
+        (off_x, off_y), scale = self._left_off, self._left_scale
+        x = (ex - off_x) / scale; y = (ey - off_y) / scale
         x = max(0.0, min(self.w-1, x)); y = max(0.0, min(self.h-1, y))
         self.cx.set(round(x,2)); self.cy.set(round(y,2)); self.refresh()
 
@@ -194,39 +330,133 @@ class BloggieGUI(tk.Tk):
         self.refresh()
 
     # ---------- Render ----------
-    def _compute_pano(self):
-        return unwarp(self.img_bgr, int(self.pano_w.get()),
-                      float(self.cx.get()), float(self.cy.get()),
-                      float(self.rmin.get()), float(self.rmax.get()),
-                      math.radians(float(self.shift_deg.get())),
-                      self.interp.get())
+    def _invalidate_maps(self, *_):
+        self._map_cache.clear()
+
+    def _maps(self, unw_w, unw_h, cx, cy, rmin, rmax, shift):
+        key = (unw_w, rmin, rmax)
+        c = self._map_cache.get(key)
+        if c is None:
+            c = self._map_cache[key] = dict(geom=None,
+                    mx=np.empty((unw_h, unw_w), np.float32), my=np.empty((unw_h, unw_w), np.float32))
+            if _build_map_nb is None:
+                radius, angle_base = _build_map_tables(unw_w, unw_h, rmin, rmax)
+                c.update(radius=radius, ca0=np.cos(angle_base), sa0=np.sin(angle_base),
+                         **{k: np.empty_like(angle_base) for k in ("tmp", "cos", "sin")})
+        mx, my = c["mx"], c["my"]
+        if c["geom"] != (cx, cy, shift):
+            if _build_map_nb is not None:
+                _build_map_nb(mx, my, unw_w, unw_h, cx, cy, rmin, rmax, shift, Y_WARP_A, Y_WARP_B, Y_WARP_C)
+            else:
+                # radius and cos/sin of the base angle are cached; the shift is applied
+                # with the angle-addition identities, so no trig per frame
+                cs, ss = math.cos(shift), math.sin(shift)
+                ca0, sa0, ca, sa, tmp = c["ca0"], c["sa0"], c["cos"], c["sin"], c["tmp"]
+                np.multiply(ca0, cs, out=ca); np.multiply(sa0, ss, out=tmp); np.subtract(ca, tmp, out=ca)
+                np.multiply(sa0, cs, out=sa); np.multiply(ca0, ss, out=tmp); np.add(sa, tmp, out=sa)
+                np.multiply(c["radius"], ca, out=mx); np.add(mx, cx, out=mx)
+                np.multiply(c["radius"], sa, out=my); np.add(my, cy, out=my)
+            c["geom"] = (cx, cy, shift)
+        return mx, my
+
+    def _compute_pano(self, width=None, interp=None):
+        interp = interp or self.interp.get()
+        unw_w = int(self.pano_w.get())
+        if width: unw_w = min(unw_w, width)
+        unw_h = int(round(unw_w / ASPECT))
+        cx, cy = float(self.cx.get()), float(self.cy.get())
+        rmin, rmax = float(self.rmin.get()), float(self.rmax.get())
+        shift = math.radians(float(self.shift_deg.get()))
+        # repeated writes of unchanged values (e.g. a spinbox at its limit) reuse the last pano
+        key = (cx, cy, rmin, rmax, unw_w, shift, interp, id(self.img_bgr))
+        if key == self._last_key: return self._last_pano
+        mx, my = self._maps(unw_w, unw_h, cx, cy, rmin, rmax, shift)
+        dst = self._buffer("pano_preview" if width else "pano", (unw_h, unw_w, 3))
+        self._last_pano = self._remap(mx, my, interp_mode(interp), dst)
+        self._last_key = key
+        return self._last_pano
+
+    def _buffer(self, name, shape):
+        # reusable output buffers, reallocated only when the requested shape changes
+        buf = self._bufs.get(name)
+        if buf is None or buf.shape != shape:
+            buf = self._bufs[name] = np.empty(shape, np.uint8)
+        return buf
+
+    def _remap(self, mx, my, mode, dst):
+        if self._backend == "cuda":  # cuda.remap takes float maps only
+            gx, gy = cv2.cuda_GpuMat(), cv2.cuda_GpuMat(); gx.upload(mx); gy.upload(my)
+            return cv2.cuda.remap(self._src_dev, gx, gy, mode, borderMode=cv2.BORDER_CONSTANT).download(dst)
+        if self._backend == "opencl" and mode != cv2.INTER_CUBIC:  # OpenCL remap: nearest/linear only
+            return cv2.remap(self._src_dev, cv2.UMat(mx), cv2.UMat(my), mode,
+                             borderMode=cv2.BORDER_CONSTANT, borderValue=0).get()
+        if self._pool is None or dst.shape[0] < 2 * self._tiles:
+            return cv2.remap(self.img_bgr, mx, my, interpolation=mode, dst=dst,
+                             borderMode=cv2.BORDER_CONSTANT, borderValue=0)
+        # row tiles: contiguous slices of the maps and of dst; cv2.remap releases the GIL
+        rows = np.linspace(0, dst.shape[0], self._tiles + 1).astype(int)
+        jobs = [self._pool.submit(cv2.remap, self.img_bgr, mx[a:b], my[a:b],
+                                  interpolation=mode, dst=dst[a:b], borderMode=cv2.BORDER_CONSTANT, borderValue=0)
+                for a, b in zip(rows[:-1], rows[1:])]
+        for job in jobs: job.result()
+        return dst
 
     def _draw_left_overlay(self):
-        img = self.img_bgr.copy()
-        cx, cy = int(round(self.cx.get())), int(round(self.cy.get()))
-        rin, rout = int(round(self.rmin.get())), int(round(self.rmax.get()))
-        cv2.circle(img, (cx, cy), 4, (0,0,255), -1)
-        cv2.circle(img, (cx, cy), rout, (0,255,0), 2)
-        cv2.circle(img, (cx, cy), rin, (255,0,0), 2)
-        cv2.line(img, (cx-12, cy), (cx+12, cy), (0,0,255), 1)
-        cv2.line(img, (cx, cy-12), (cx, cy+12), (0,0,255), 1)
+        img = self._left_buf; np.copyto(img, self._left_small)
+        s = self._left_scale
+        cx, cy = int(round(self.cx.get() * s)), int(round(self.cy.get() * s))
+        rin, rout = int(round(self.rmin.get() * s)), int(round(self.rmax.get() * s))
+        cv2.circle(img, (cx, cy), 2, (0,0,255), -1)
+        cv2.circle(img, (cx, cy), rout, (0,255,0), 1)
+        cv2.circle(img, (cx, cy), rin, (255,0,0), 1)
+        cv2.line(img, (cx-6, cy), (cx+6, cy), (0,0,255), 1)
+        cv2.line(img, (cx, cy-6), (cx, cy+6), (0,0,255), 1)
         return img
 
     def refresh(self, force=False):
-        if not force:
-            if self._pending is not None: return
-            self._pending = self.after(30, self._refresh_impl)
-        else: self._refresh_impl()
+        # latest-wins: a burst of slider/drag events collapses into one render once Tk is idle
+        if self._pending is not None:
+            self.after_cancel(self._pending); self._pending = None
+        if force: self._refresh_impl()
+        else: self._pending = self.after_idle(self._refresh_impl)
 
     def _refresh_impl(self):
         self._pending = None
         if self.img_bgr is None: return
-        left_img = self._draw_left_overlay()
-        tk_left, _ = cv2_to_tk(left_img, 600, 600)
-        self.left.imgtk = tk_left; self.left.configure(image=tk_left)
-        pano = self._compute_pano()
-        tk_right, _ = cv2_to_tk(pano, 640, 600)
-        self.right.imgtk = tk_right; self.right.configure(image=tk_right)
+        if self._dragging or self._shift_scrubbing: self._refresh_preview_fast()
+        else: self._refresh_full()
+
+    def _refresh_preview_fast(self):
+        # display-sized pano and OpenCV resizes while dragging/scrubbing
+        self._render(self._preview_w, fast=True)
+
+    def _refresh_full(self):
+        # full pano_w once the interaction settles (mouse release on the image or slider)
+        self._render(None, fast=False)
+
+    def _render(self, width, fast):
+        # the left panel only depends on the overlay geometry; rotation/interp changes skip it
+        overlay_state = (self.cx.get(), self.cy.get(), self.rmin.get(), self.rmax.get())
+        if overlay_state != self._last_overlay_state:
+            self._last_overlay_state = overlay_state
+            blit_bgr(self._left_disp, self._draw_left_overlay())  # already display-sized
+            self._left_ptk.paste(self._left_pil)
+        self._refresh_right_only(width, fast)
+
+    def _refresh_right_only(self, width, fast):
+        # while interacting, linear regardless of the chosen mode; the settled render uses it
+        pano = self._compute_pano(width, INTERP_DURING_DRAG if fast else None)
+        if self._last_key == self._shown_key: return  # right panel already shows this pano
+        self._shown_key = self._last_key
+        h, w = pano.shape[:2]
+        fit_w, fit_h = fit_size(w, h, 640, 600)
+        if (fit_w, fit_h) != (w, h):
+            # INTER_AREA for settled frames too: area averaging does not alias when shrinking
+            # (1200 -> 640 by default) and is much cheaper than Lanczos
+            pano = cv2.resize(pano, (fit_w, fit_h), dst=self._buffer("right", (fit_h, fit_w, 3)),
+                              interpolation=cv2.INTER_AREA)
+        blit_bgr(self._right_disp, pano)
+        self._right_ptk.paste(self._right_pil)
 
 if __name__ == "__main__":
     BloggieGUI().mainloop()